@@ -1,12 +1,16 @@
+import re
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import Optional
-from datetime import datetime, date
-from .backtest import run_backtest
+from typing import List, Optional
+from datetime import date
+from .backtest import MAX_SWEEP_COMBOS, run_backtest, run_sweep
 from .strategies import MovingAverageCrossover
 
 router = APIRouter()
 
+# date.fromisoformat also accepts forms like 20220101 and 2022-W01-1 on 3.11+
+DATE_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
 class BacktestRequest(BaseModel):
     symbol: str
     start_date: str  # Format: YYYY-MM-DD
@@ -32,6 +36,58 @@ class BacktestResponse(BaseModel):
     fast_period: int
     slow_period: int
 
+class SweepRequest(BaseModel):
+    symbol: str
+    start_date: str  # Format: YYYY-MM-DD
+    end_date: str    # Format: YYYY-MM-DD
+    initial_cash: Optional[float] = 100000.0
+    fast_periods: List[int]
+    slow_periods: List[int]
+
+class SweepResult(BaseModel):
+    fast_period: int
+    slow_period: int
+    final_cash: float
+    profit_loss: float
+    profit_loss_percent: float
+    total_trades: int
+
+class SweepResponse(BaseModel):
+    symbol: str
+    start_date: str
+    end_date: str
+    initial_cash: float
+    strategy: str
+    results: List[SweepResult]
+
+def _validate_common(start_date: str, end_date: str, initial_cash: float):
+    """Validate the date range and cash amount shared by all backtest requests"""
+    # Validate date format
+    try:
+        if not (DATE_PATTERN.fullmatch(start_date) and DATE_PATTERN.fullmatch(end_date)):
+            raise ValueError("Dates must be YYYY-MM-DD")
+        start_dt = date.fromisoformat(start_date)
+        end_dt = date.fromisoformat(end_date)
+    except ValueError:
+        raise HTTPException(
+            status_code=400, 
+            detail="Invalid date format. Use YYYY-MM-DD"
+        )
+    
+    # Validate date range
+    if start_dt >= end_dt:
+        raise HTTPException(
+            status_code=400,
+            detail="Start date must be before end date"
+        )
+    
+    # Validate cash amount
+    if initial_cash <= 0:
+        raise HTTPException(
+            status_code=400,
+            detail="Initial cash must be positive"
+        )
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -41,31 +97,15 @@ async def health_check():
 async def execute_backtest(request: BacktestRequest):
     """Execute a backtest with Moving Average Crossover strategy"""
     try:
-        # Validate date format
-        try:
-            start_dt = datetime.strptime(request.start_date, "%Y-%m-%d").date()
-            end_dt = datetime.strptime(request.end_date, "%Y-%m-%d").date()
-        except ValueError:
-            raise HTTPException(
-                status_code=400, 
-                detail="Invalid date format. Use YYYY-MM-DD"
-            )
-        
-        # Validate date range
-        if start_dt >= end_dt:
-            raise HTTPException(
-                status_code=400,
-                detail="Start date must be before end date"
-            )
+        _validate_common(request.start_date, request.end_date, request.initial_cash)
         
-        # Validate cash amount
-        if request.initial_cash <= 0:
+        # Validate moving average periods
+        if request.fast_period < 1:
             raise HTTPException(
                 status_code=400,
-                detail="Initial cash must be positive"
+                detail="Fast and slow periods must be positive integers"
             )
         
-        # Validate moving average periods
         if request.fast_period >= request.slow_period:
             raise HTTPException(
                 status_code=400,
@@ -92,6 +132,53 @@ async def execute_backtest(request: BacktestRequest):
             detail=f"Backtest execution failed: {str(e)}"
         )
 
+@router.post("/backtest/sweep", response_model=SweepResponse)
+async def execute_sweep(request: SweepRequest):
+    """Execute Moving Average Crossover backtests over a grid of periods"""
+    try:
+        _validate_common(request.start_date, request.end_date, request.initial_cash)
+        
+        # Validate moving average periods, ignoring duplicates
+        fast_periods = list(dict.fromkeys(request.fast_periods))
+        slow_periods = list(dict.fromkeys(request.slow_periods))
+        if not fast_periods or not slow_periods or min(fast_periods + slow_periods) <= 0:
+            raise HTTPException(
+                status_code=400,
+                detail="Fast and slow periods must be non-empty lists of positive integers"
+            )
+        
+        if min(fast_periods) >= max(slow_periods):
+            raise HTTPException(
+                status_code=400,
+                detail="At least one fast period must be less than a slow period"
+            )
+        
+        if len(fast_periods) * len(slow_periods) > MAX_SWEEP_COMBOS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {MAX_SWEEP_COMBOS} period combinations are allowed"
+            )
+        
+        # Run sweep
+        results = await run_sweep(
+            symbol=request.symbol,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            fast_periods=fast_periods,
+            slow_periods=slow_periods,
+            initial_cash=request.initial_cash
+        )
+        
+        return SweepResponse(**results)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Sweep execution failed: {str(e)}"
+        )
+
 @router.get("/strategies")
 async def list_strategies():
     """List available trading strategies"""
@@ -2,8 +2,39 @@ import backtrader as bt
 import yfinance as yf
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from .strategies import MovingAverageCrossover
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from datetime import date
+from functools import lru_cache
+from numpy.lib.stride_tricks import sliding_window_view
+from pathlib import Path
+from .strategies import MACrossSignal, MovingAverageCrossover
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import config as numba_config, njit, prange
+    NUMBA_AVAILABLE = True
+    
+    # Parallel kernels are launched from worker threads (asyncio.to_thread,
+    # TestClient's portal). A TBB pool first started off the main thread
+    # blocks interpreter exit, so prefer OpenMP and workqueue unless the
+    # deployment picks a layer explicitly.
+    if 'NUMBA_THREADING_LAYER_PRIORITY' not in os.environ:
+        numba_config.THREADING_LAYER_PRIORITY = ['omp', 'workqueue', 'tbb']
+except ImportError:  # numba is optional, fall back to the NumPy kernel
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        def decorator(func):
+            return func
+        return decorator
 
 class BacktestAnalyzer(bt.Analyzer):
     """Custom analyzer to collect backtest results"""
@@ -33,10 +64,20 @@ class BacktestAnalyzer(bt.Analyzer):
             'final_cash': self.final_cash
         }
 
-def create_mock_data(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
-    """Create mock stock data for demonstration purposes"""
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+OHLCV_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+# float32 keeps cent precision only below 2**16, higher prices stay float64
+FLOAT32_MAX_PRICE = 2.0 ** 16
+
+@lru_cache(maxsize=128)
+def _mock_ohlcv(symbol: str, start_date: str, end_date: str) -> tuple:
+    """Mock OHLCV data as a date index and a dict of read-only column arrays
+    
+    The series is deterministic per (symbol, start_date, end_date), so it is
+    cached and shared between calls.
+    """
+    start_dt = date.fromisoformat(start_date)
+    end_dt = date.fromisoformat(end_date)
     
     # Generate date range
     date_range = pd.date_range(start=start_dt, end=end_dt, freq='D')
@@ -54,120 +95,542 @@ def create_mock_data(symbol: str, start_date: str, end_date: str) -> pd.DataFram
     }
     base_price = base_prices.get(symbol, 100.0)
     
-    # Generate realistic price movements
-    np.random.seed(42)  # For reproducible results
+    # Generate realistic price movements. Each call gets its own generator
+    # so concurrent requests never share RNG state.
+    rng = np.random.default_rng(42)  # For reproducible results
     
     # Generate returns with some trend and volatility
-    daily_returns = np.random.normal(0.001, 0.02, n_days)  # 0.1% daily return, 2% volatility
+    daily_returns = rng.standard_normal(n_days) * 0.02 + 0.001  # 0.1% daily return, 2% volatility
+    # Uniform draws for the high, low, open and volume of every bar
+    unif = rng.uniform(size=(n_days, 4))
     
     # Add some trend
     trend = np.linspace(-0.1, 0.15, n_days)  # Slight upward trend over time
     daily_returns += trend / n_days
     
-    # Calculate cumulative prices
-    prices = [base_price]
-    for ret in daily_returns[1:]:
-        new_price = prices[-1] * (1 + ret)
-        prices.append(max(new_price, 1.0))  # Prevent negative prices
-    
-    # Create OHLCV data
-    data = pd.DataFrame(index=date_range[:len(prices)])
-    
-    for i, price in enumerate(prices):
-        # Generate realistic OHLC from close price
-        volatility = 0.015  # 1.5% intraday volatility
-        high = price * (1 + np.random.uniform(0, volatility))
-        low = price * (1 - np.random.uniform(0, volatility))
-        open_price = price * (1 + np.random.uniform(-volatility/2, volatility/2))
-        
-        data.loc[data.index[i], 'Open'] = round(open_price, 2)
-        data.loc[data.index[i], 'High'] = round(max(high, price, open_price), 2)
-        data.loc[data.index[i], 'Low'] = round(min(low, price, open_price), 2)
-        data.loc[data.index[i], 'Close'] = round(price, 2)
-        data.loc[data.index[i], 'Adj Close'] = round(price, 2)
-        data.loc[data.index[i], 'Volume'] = int(np.random.uniform(1000000, 10000000))
+    # Calculate cumulative prices, starting exactly at the base price
+    daily_returns[0] = 0.0
+    # Prevent negative prices. Unlike clamping inside the compounding loop,
+    # bars after a clamp keep compounding from the unclamped path.
+    prices = np.maximum(base_price * np.cumprod(1.0 + daily_returns), 1.0)
     
-    return data
-
-async def run_backtest(
-    symbol: str,
-    start_date: str,
-    end_date: str,
-    initial_cash: float = 100000.0,
-    fast_period: int = 10,
-    slow_period: int = 30
-) -> dict:
-    """Run backtest with Moving Average Crossover strategy"""
+    # Generate realistic OHLCV columns from the close prices in one pass
+    n = len(prices)
+    volatility = 0.015  # 1.5% intraday volatility
+    high_var = unif[:, 0] * volatility
+    low_var = unif[:, 1] * volatility
+    open_var = (unif[:, 2] - 0.5) * volatility
     
-    try:
-        # Try to download data from Yahoo Finance first
+    open_ = prices * (1 + open_var)
+    high = np.maximum.reduce([prices * (1 + high_var), prices, open_])
+    low = np.minimum.reduce([prices * (1 - low_var), prices, open_])
+    volume = (1000000 + unif[:, 3] * 9000000).astype(np.int32)
+    
+    # Round all price columns to cents in a single ufunc call. float32 halves
+    # the memory where it still holds cents, otherwise keep float64.
+    ohlc = np.round(np.stack([open_, high, low, prices]), 2)
+    if np.max(ohlc) < FLOAT32_MAX_PRICE:
+        ohlc = ohlc.astype(np.float32)
+    open_, high, low, close = ohlc
+    
+    columns = {
+        'Open': open_,
+        'High': high,
+        'Low': low,
+        'Close': close,
+        'Adj Close': close,
+        'Volume': volume
+    }
+    for arr in columns.values():
+        arr.flags.writeable = False
+    
+    return date_range[:n], columns
+
+def create_mock_data(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Create mock stock data for demonstration purposes"""
+    index, columns = _mock_ohlcv(symbol, start_date, end_date)
+    return pd.DataFrame(columns, index=index)
+
+# On-disk cache for downloaded price data
+CACHE_DIR = Path(tempfile.gettempdir())
+PARQUET_MIN_ROWS = 30  # Tiny ranges are cheaper to download again than to persist
+
+# Bound the time spent on Yahoo Finance before falling back to mock data
+DOWNLOAD_TIMEOUT = 5  # Seconds per attempt
+DOWNLOAD_ATTEMPTS = 2  # First try plus a single retry
+
+def _cache_path(symbol: str, start_date: str, end_date: str) -> Path:
+    """Parquet file used to persist the download for this request"""
+    key = hashlib.sha1(f"{symbol}|{start_date}|{end_date}".encode()).hexdigest()[:16]
+    return CACHE_DIR / f"anka_{key}.parquet"
+
+def _download(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Download data from Yahoo Finance, raising ValueError when nothing is returned"""
+    # yfinance reports most failures by returning an empty frame
+    for _ in range(DOWNLOAD_ATTEMPTS):
         try:
             data = yf.download(
                 symbol, 
                 start=start_date, 
                 end=end_date,
-                progress=False
+                progress=False,
+                timeout=DOWNLOAD_TIMEOUT
             )
         except Exception:
-            data = pd.DataFrame()  # Empty dataframe if download fails
-        
-        # If no data from yfinance, use mock data
-        if data.empty:
-            print(f"Warning: Could not fetch real data for {symbol}. Using mock data for demonstration.")
-            data = create_mock_data(symbol, start_date, end_date)
-        
-        if data.empty:
-            raise ValueError(f"No data available for symbol {symbol} in the specified date range")
+            data = pd.DataFrame()
+        if not data.empty:
+            return data
+    
+    raise ValueError(f"No data returned for {symbol} after {DOWNLOAD_ATTEMPTS} attempts")
+
+def _write_parquet(data: pd.DataFrame, path: Path):
+    """Persist data atomically, so readers never see a partially written file
+    
+    Persisting is best effort: any failure, including an unwritable cache
+    directory, is swallowed so it never discards a successful download.
+    """
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, prefix='anka_', suffix='.tmp')
+        os.close(fd)
+        data.to_parquet(tmp)
+        os.replace(tmp, path)
+    except Exception:
+        pass  # The in-memory cache still applies
+    finally:
+        if tmp is not None and os.path.exists(tmp):
+            os.unlink(tmp)
+
+@lru_cache(maxsize=128)
+def _fetch_complete(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Download a range that can no longer change, cached in memory and on disk"""
+    path = _cache_path(symbol, start_date, end_date)
+    if path.exists():
+        try:
+            return pd.read_parquet(path)
+        except Exception:
+            # Unreadable cache file, drop it and download again
+            path.unlink(missing_ok=True)
+    
+    data = _download(symbol, start_date, end_date)
+    if len(data) >= PARQUET_MIN_ROWS:
+        _write_parquet(data, path)
+    
+    return data
+
+def _fetch(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Download data from Yahoo Finance, cached once the range is complete
+    
+    Raises ValueError when nothing is returned so failed downloads are not
+    cached. The returned frame may be shared between calls and must not be
+    modified.
+    """
+    # Ranges ending after today can still gain bars, so they are never cached
+    if date.fromisoformat(end_date) > date.today():
+        return _download(symbol, start_date, end_date)
+    
+    return _fetch_complete(symbol, start_date, end_date)
+
+COMMISSION = 0.001  # 0.1% per side, same as the Backtrader broker setup
+
+def _summarize(close: np.ndarray, equity: np.ndarray, trades: np.ndarray, commission: float) -> dict:
+    """Derive trade and drawdown statistics from an equity curve and its trade transitions"""
+    entries = np.flatnonzero(trades > 0)
+    exits = np.flatnonzero(trades < 0)
+    
+    # Per-trade PnL of closed round trips, net of commission on both legs
+    entry_prices = close[entries[:exits.size]]
+    exit_prices = close[exits]
+    trade_pnl = exit_prices - entry_prices - (entry_prices + exit_prices) * commission
+    
+    peak = np.maximum.accumulate(equity)
+    moneydown = peak - equity
+    
+    return {
+        'final_cash': float(equity[-1]),
+        'total_trades': int(exits.size),
+        'winning_trades': int(np.count_nonzero(trade_pnl >= 0)),
+        'losing_trades': int(np.count_nonzero(trade_pnl < 0)),
+        'max_drawdown': float(moneydown.max()),
+        'max_drawdown_percent': float((moneydown / peak).max() * 100)
+    }
+
+def _kernel_prices(close: np.ndarray) -> np.ndarray:
+    """Contiguous close prices for the kernels, as float32 where cents fit"""
+    close = np.asarray(close)
+    fits = close.size and np.nanmax(close) < FLOAT32_MAX_PRICE
+    return np.ascontiguousarray(close, dtype=np.float32 if fits else np.float64)
+
+def _rolling_mean(x: np.ndarray, n: int, windowed: bool = False) -> np.ndarray:
+    """Simple moving average over full windows, accumulated in float64
+    
+    Runs in O(N) via a cumulative sum. Pass ``windowed=True`` to average a
+    zero-copy sliding window view instead, which sums every window on its
+    own in O(N*W).
+    """
+    if windowed:
+        return sliding_window_view(x, n).mean(axis=-1, dtype=np.float64)
+    
+    c = np.concatenate(([0.0], np.cumsum(x, dtype=np.float64)))
+    return (c[n:] - c[:-n]) / n
+
+def _np_core(
+    close: np.ndarray,
+    fast: int,
+    slow: int,
+    cash: float,
+    commission: float,
+    windowed: bool = False
+) -> tuple:
+    """NumPy crossover kernel, returns the equity curve and trade transitions
+    
+    ``windowed`` is forwarded to _rolling_mean.
+    """
+    n = close.size
+    
+    # Position held at the end of each bar (1 = long, 0 = flat)
+    signal = np.zeros(n, dtype=np.int8)
+    if n >= slow:
+        fast_sma = _rolling_mean(close, fast, windowed)[slow - fast:]
+        slow_sma = _rolling_mean(close, slow, windowed)
+        above = fast_sma > slow_sma
+        # Like CrossOver, only enter after an actual upward cross
+        armed = np.maximum.accumulate(~above)
+        want = np.zeros(n + 1, dtype=np.int8)
+        want[slow - 1:n] = above & armed
         
-        # Create Cerebro engine
-        cerebro = bt.Cerebro()
+        # Each run of bars wanting a position is one candidate trade. Like
+        # the broker, skip entries the cash cannot cover; the signal then
+        # waits for the next upward cross.
+        edges = np.flatnonzero(np.diff(want, prepend=0))
+        value = cash
+        for start, stop in zip(edges[::2], edges[1::2]):
+            entry = float(close[start])
+            if value < entry * (1 + commission):
+                continue
+            signal[start:stop] = 1
+            if stop < n:
+                exit_ = float(close[stop])
+                value += exit_ - entry - (entry + exit_) * commission
+    
+    trades = np.diff(signal, prepend=0)
+    costs = np.abs(trades) * close * commission
+    signal_shifted = np.concatenate(([0], signal[:-1]))
+    equity = cash + np.cumsum(signal_shifted * np.diff(close, prepend=close[0]) - costs)
+    
+    return equity, trades
+
+@njit(cache=True, fastmath=True)
+def _bt_core(close, fast, slow, cash, commission):
+    """Single-pass crossover kernel, same outputs as _np_core
+    
+    Both SMAs are maintained as incremental rolling sums, so the SMA,
+    position, cost and equity updates are fused into one loop. Prices are
+    usually read as float32 (see _kernel_prices) while the sums and equity
+    are accumulated in float64.
+    The loop body has no data-dependent branches: SMAs are compared as
+    cross-multiplied window sums and the position change is plain integer
+    arithmetic, which LLVM lowers to selects.
+    """
+    n = close.shape[0]
+    # Flat until the slow SMA is defined
+    equity = np.full(n, cash, dtype=np.float64)
+    trades = np.zeros(n, dtype=np.int8)
+    if n < slow:
+        return equity, trades
+    
+    # Prime the rolling sums with the bars preceding the first full window
+    s_fast = 0.0
+    s_slow = 0.0
+    for i in range(slow - 1):
+        s_slow += close[i]
+    for i in range(slow - fast, slow - 1):
+        s_fast += close[i]
+    
+    pos = 0
+    armed = 0
+    value = cash
+    for i in range(slow - 1, n):
+        s_fast += close[i]
+        s_slow += close[i]
+        value += pos * (close[i] - close[i - 1])
         
-        # Add data to Cerebro
-        data_feed = bt.feeds.PandasData(dataname=data)
-        cerebro.adddata(data_feed)
+        # s_fast / fast > s_slow / slow without the divisions
+        above = int(s_fast * slow > s_slow * fast)
+        # Like CrossOver, only enter after an actual upward cross
+        armed |= 1 - above
+        want = above & armed
+        # The broker rejects entries the cash cannot cover, and a rejected
+        # entry waits for the next upward cross
+        afford = int(value >= close[i] * (1 + commission))
+        new_pos = want & (pos | afford)
+        armed &= 1 - (want & (1 - new_pos))
+        delta = new_pos - pos
+        value -= abs(delta) * close[i] * commission
+        trades[i] = delta
+        pos = new_pos
+        equity[i] = value
         
-        # Add strategy
-        cerebro.addstrategy(
-            MovingAverageCrossover,
-            fast_period=fast_period,
-            slow_period=slow_period
+        # Drop the oldest bar of each window for the next iteration
+        s_fast -= close[i + 1 - fast]
+        s_slow -= close[i + 1 - slow]
+    
+    return equity, trades
+
+def vectorized_ma_crossover(
+    close: np.ndarray,
+    fast: int,
+    slow: int,
+    cash: float,
+    commission: float
+) -> dict:
+    """Vectorized Moving Average Crossover backtest over a close price series
+    
+    Mirrors MovingAverageCrossover with Backtrader's default one-unit sizer:
+    go long when the fast SMA crosses above the slow SMA and close the
+    position when it crosses below. Entries the cash cannot cover are
+    skipped like the broker's margin rejections. Orders fill at the signal
+    bar's close rather than at the next bar's open.
+    """
+    # The kernels index by window length without bounds checks
+    if not 1 <= fast < slow:
+        raise ValueError("Periods must satisfy 1 <= fast_period < slow_period")
+    
+    close = _kernel_prices(close)
+    core = _bt_core if NUMBA_AVAILABLE else _np_core
+    equity, trades = core(close, fast, slow, cash, commission)
+    
+    return _summarize(close, equity, trades, commission)
+
+# Upper bound on (fast, slow) pairs per sweep. Results are built in Python
+# while _SWEEP_LOCK is held, so huge grids would stall every other sweep.
+MAX_SWEEP_COMBOS = 10000
+
+# Backtests run in worker threads and some Numba threading layers (e.g.
+# workqueue) cannot launch parallel kernels concurrently. A sweep already
+# uses every core, so serialising them costs no throughput.
+_SWEEP_LOCK = threading.Lock()
+
+@njit(cache=True, fastmath=True)
+def _sweep_core(close, csum, fast, slow, cash, commission):
+    """Final equity and closed trade count of one combination
+    
+    Same branchless logic as _bt_core, but both window sums are read from
+    the prefix sum shared by the whole sweep (csum[i] is the sum of
+    close[:i]) and no per-bar arrays are allocated.
+    """
+    pos = 0
+    armed = 0
+    value = cash
+    closed = 0
+    # Positions can only open once the slow SMA is defined
+    for i in range(slow - 1, close.shape[0]):
+        value += pos * (close[i] - close[i - 1])
+        s_fast = csum[i + 1] - csum[i + 1 - fast]
+        s_slow = csum[i + 1] - csum[i + 1 - slow]
+        above = int(s_fast * slow > s_slow * fast)
+        armed |= 1 - above
+        want = above & armed
+        afford = int(value >= close[i] * (1 + commission))
+        new_pos = want & (pos | afford)
+        armed &= 1 - (want & (1 - new_pos))
+        closed += pos & (1 - new_pos)
+        value -= abs(new_pos - pos) * close[i] * commission
+        pos = new_pos
+    
+    return value, closed
+
+@njit(cache=True, parallel=True)
+def _sweep(close, csum, fasts, slows, cash, commission, out_equity, out_trades):
+    """Run _sweep_core for every (fasts[i], slows[i]) combination in parallel"""
+    for i in prange(fasts.shape[0]):
+        out_equity[i], out_trades[i] = _sweep_core(
+            close, csum, fasts[i], slows[i], cash, commission
         )
+
+def sweep_ma_crossover(
+    close: np.ndarray,
+    fasts: np.ndarray,
+    slows: np.ndarray,
+    cash: float,
+    commission: float
+) -> tuple:
+    """Final equity and closed trade count for each (fast, slow) combination"""
+    close = _kernel_prices(close)
+    fasts = np.ascontiguousarray(fasts, dtype=np.int64)
+    slows = np.ascontiguousarray(slows, dtype=np.int64)
+    if fasts.size and (fasts.min() < 1 or np.any(fasts >= slows)):
+        raise ValueError("Periods must satisfy 1 <= fast_period < slow_period")
+    
+    out_equity = np.empty(fasts.size, dtype=np.float64)
+    out_trades = np.empty(fasts.size, dtype=np.int64)
+    
+    if NUMBA_AVAILABLE:
+        # Prefix sum computed once, every SMA of every combination is a
+        # difference of two of its entries
+        csum = np.concatenate(([0.0], np.cumsum(close, dtype=np.float64)))
+        with _SWEEP_LOCK:
+            _sweep(close, csum, fasts, slows, cash, commission, out_equity, out_trades)
+    else:
+        for i in range(fasts.size):
+            equity, trades = _np_core(close, fasts[i], slows[i], cash, commission)
+            out_equity[i] = equity[-1]
+            out_trades[i] = np.count_nonzero(trades < 0)
+    
+    return out_equity, out_trades
+
+def warmup():
+    """Compile the Numba kernels on a dummy series
+    
+    With cache=True the compiled code is also written to disk, so later
+    processes load it instead of compiling on their first request.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    
+    # Both price dtypes _kernel_prices can hand out
+    for dtype in (np.float32, np.float64):
+        close = np.ones(60, dtype=dtype)
+        _bt_core(close, 10, 30, 100000.0, COMMISSION)
+        sweep_ma_crossover(close, np.array([10]), np.array([30]), 100000.0, COMMISSION)
+
+def _run_backtrader(
+    index: pd.DatetimeIndex,
+    columns: dict,
+    initial_cash: float,
+    fast_period: int,
+    slow_period: int,
+    use_signal_strategy: bool = True
+) -> dict:
+    """Run the Moving Average Crossover strategy through Backtrader's event loop
+    
+    The crossover runs as a SignalStrategy by default; pass
+    ``use_signal_strategy=False`` to run the MovingAverageCrossover strategy
+    for parity checks.
+    """
+    # Create Cerebro engine
+    cerebro = bt.Cerebro()
+    
+    # Add data to Cerebro. PandasDirectData reads each bar positionally from
+    # itertuples() instead of indexing the frame by column, so build the frame
+    # with the columns in its default order (the index provides the datetime).
+    data = pd.DataFrame({col: columns[col] for col in OHLCV_COLUMNS}, index=index)
+    data_feed = bt.feeds.PandasDirectData(dataname=data, openinterest=-1)
+    cerebro.adddata(data_feed)
+    
+    # Add strategy
+    strategy = MACrossSignal if use_signal_strategy else MovingAverageCrossover
+    cerebro.addstrategy(
+        strategy,
+        fast_period=fast_period,
+        slow_period=slow_period
+    )
+    
+    # Set initial cash
+    cerebro.broker.setcash(initial_cash)
+    
+    # Add commission (0.1%)
+    cerebro.broker.setcommission(commission=COMMISSION)
+    
+    # Add analyzers
+    cerebro.addanalyzer(BacktestAnalyzer, _name='custom')
+    cerebro.addanalyzer(bt.analyzers.DrawDown, _name='drawdown')
+    cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name='trades')
+    
+    # Run backtest
+    results = cerebro.run()
+    strategy_result = results[0]
+    
+    # Extract results
+    custom_analysis = strategy_result.analyzers.custom.get_analysis()
+    drawdown_analysis = strategy_result.analyzers.drawdown.get_analysis()
+    trade_analysis = strategy_result.analyzers.trades.get_analysis()
+    
+    # Look up each analysis section once
+    totals = trade_analysis.get('total') or {}
+    won = trade_analysis.get('won') or {}
+    lost = trade_analysis.get('lost') or {}
+    dd_max = drawdown_analysis.get('max') or {}
+    
+    return {
+        'final_cash': custom_analysis['final_cash'],
+        # Trade statistics
+        'total_trades': totals.get('closed', 0),
+        'winning_trades': won.get('total', 0),
+        'losing_trades': lost.get('total', 0),
+        # Drawdown statistics
+        'max_drawdown': dd_max.get('moneydown', 0.0),
+        'max_drawdown_percent': dd_max.get('drawdown', 0.0)
+    }
+
+def _load_data(symbol: str, start_date: str, end_date: str) -> tuple:
+    """Price data for the request as a date index and OHLCV column arrays
+    
+    Falls back to mock data, which is generated straight into arrays without
+    building a DataFrame.
+    """
+    # Try to download data from Yahoo Finance first
+    try:
+        data = _fetch(symbol, start_date, end_date)
+        index = data.index
+        columns = {col: data[col].to_numpy() for col in OHLCV_COLUMNS}
+    except Exception as e:
+        # If no data from yfinance, use mock data
+        logger.warning(
+            "Could not fetch real data for %s (%s). Using mock data for demonstration.",
+            symbol, e
+        )
+        index, columns = _mock_ohlcv(symbol, start_date, end_date)
+    
+    if len(index) == 0:
+        raise ValueError(f"No data available for symbol {symbol} in the specified date range")
+    
+    return index, columns
+
+def _run_backtest_sync(
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    initial_cash: float = 100000.0,
+    fast_period: int = 10,
+    slow_period: int = 30,
+    use_backtrader: bool = False,
+    use_signal_strategy: bool = True
+) -> dict:
+    """Run backtest with Moving Average Crossover strategy
+    
+    The vectorized NumPy backtest is used by default; pass
+    ``use_backtrader=True`` to run the original Backtrader event loop,
+    e.g. for regression checks. ``use_signal_strategy`` is forwarded to
+    the Backtrader run.
+    """
+    
+    try:
+        index, columns = _load_data(symbol, start_date, end_date)
         
-        # Set initial cash
-        cerebro.broker.setcash(initial_cash)
-        
-        # Add commission (0.1%)
-        cerebro.broker.setcommission(commission=0.001)
-        
-        # Add analyzers
-        cerebro.addanalyzer(BacktestAnalyzer, _name='custom')
-        cerebro.addanalyzer(bt.analyzers.DrawDown, _name='drawdown')
-        cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name='trades')
-        
-        # Run backtest
-        results = cerebro.run()
-        strategy_result = results[0]
-        
-        # Extract results
-        custom_analysis = strategy_result.analyzers.custom.get_analysis()
-        drawdown_analysis = strategy_result.analyzers.drawdown.get_analysis()
-        trade_analysis = strategy_result.analyzers.trades.get_analysis()
+        if use_backtrader:
+            stats = _run_backtrader(
+                index,
+                columns,
+                initial_cash,
+                fast_period,
+                slow_period,
+                use_signal_strategy
+            )
+        else:
+            stats = vectorized_ma_crossover(
+                columns['Close'],
+                fast_period,
+                slow_period,
+                initial_cash,
+                COMMISSION
+            )
         
         # Calculate metrics
-        initial_cash = custom_analysis['initial_cash']
-        final_cash = custom_analysis['final_cash']
+        final_cash = stats['final_cash']
         profit_loss = final_cash - initial_cash
         profit_loss_percent = (profit_loss / initial_cash) * 100
         
-        # Trade statistics
-        total_trades = trade_analysis.get('total', {}).get('closed', 0)
-        winning_trades = trade_analysis.get('won', {}).get('total', 0)
-        losing_trades = trade_analysis.get('lost', {}).get('total', 0)
-        
-        # Drawdown statistics
-        max_drawdown = drawdown_analysis.get('max', {}).get('moneydown', 0.0)
-        max_drawdown_percent = drawdown_analysis.get('max', {}).get('drawdown', 0.0)
-        
         return {
             'symbol': symbol,
             'start_date': start_date,
@@ -176,11 +639,11 @@ async def run_backtest(
             'final_cash': final_cash,
             'profit_loss': round(profit_loss, 2),
             'profit_loss_percent': round(profit_loss_percent, 2),
-            'total_trades': total_trades,
-            'winning_trades': winning_trades,
-            'losing_trades': losing_trades,
-            'max_drawdown': round(abs(max_drawdown), 2),
-            'max_drawdown_percent': round(max_drawdown_percent, 2),
+            'total_trades': stats['total_trades'],
+            'winning_trades': stats['winning_trades'],
+            'losing_trades': stats['losing_trades'],
+            'max_drawdown': round(abs(stats['max_drawdown']), 2),
+            'max_drawdown_percent': round(stats['max_drawdown_percent'], 2),
             'strategy': 'MovingAverageCrossover',
             'fast_period': fast_period,
             'slow_period': slow_period
@@ -188,3 +651,111 @@ async def run_backtest(
         
     except Exception as e:
         raise Exception(f"Backtest execution failed: {str(e)}")
+
+def _run_sweep_sync(
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    fast_periods: list,
+    slow_periods: list,
+    initial_cash: float = 100000.0
+) -> dict:
+    """Run Moving Average Crossover backtests over a grid of periods
+    
+    Every combination with fast_period < slow_period is evaluated on the
+    same close series. Duplicate periods are ignored and at most
+    MAX_SWEEP_COMBOS pairs are accepted.
+    """
+    
+    try:
+        # Deduplicate while keeping the requested order
+        fast_periods = list(dict.fromkeys(fast_periods))
+        slow_periods = list(dict.fromkeys(slow_periods))
+        if len(fast_periods) * len(slow_periods) > MAX_SWEEP_COMBOS:
+            raise ValueError(f"At most {MAX_SWEEP_COMBOS} period combinations are allowed")
+        
+        combos = [(f, s) for f in fast_periods for s in slow_periods if f < s]
+        if not combos:
+            raise ValueError("No combination with fast period less than slow period")
+        
+        _, columns = _load_data(symbol, start_date, end_date)
+        
+        fasts = np.array([f for f, _ in combos], dtype=np.int64)
+        slows = np.array([s for _, s in combos], dtype=np.int64)
+        final_equity, closed_trades = sweep_ma_crossover(
+            columns['Close'],
+            fasts,
+            slows,
+            initial_cash,
+            COMMISSION
+        )
+        
+        results = []
+        for (fast_period, slow_period), final_cash, total_trades in zip(combos, final_equity, closed_trades):
+            profit_loss = float(final_cash) - initial_cash
+            results.append({
+                'fast_period': fast_period,
+                'slow_period': slow_period,
+                'final_cash': float(final_cash),
+                'profit_loss': round(profit_loss, 2),
+                'profit_loss_percent': round((profit_loss / initial_cash) * 100, 2),
+                'total_trades': int(total_trades)
+            })
+        
+        return {
+            'symbol': symbol,
+            'start_date': start_date,
+            'end_date': end_date,
+            'initial_cash': initial_cash,
+            'strategy': 'MovingAverageCrossover',
+            'results': results
+        }
+        
+    except Exception as e:
+        raise Exception(f"Sweep execution failed: {str(e)}")
+
+async def run_backtest(
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    initial_cash: float = 100000.0,
+    fast_period: int = 10,
+    slow_period: int = 30,
+    use_backtrader: bool = False,
+    use_signal_strategy: bool = True
+) -> dict:
+    """Run _run_backtest_sync in a worker thread
+    
+    The download and backtest are blocking, offloading them keeps the event
+    loop free to serve other requests meanwhile.
+    """
+    return await asyncio.to_thread(
+        _run_backtest_sync,
+        symbol=symbol,
+        start_date=start_date,
+        end_date=end_date,
+        initial_cash=initial_cash,
+        fast_period=fast_period,
+        slow_period=slow_period,
+        use_backtrader=use_backtrader,
+        use_signal_strategy=use_signal_strategy
+    )
+
+async def run_sweep(
+    symbol: str,
+    start_date: str,
+    end_date: str,
+    fast_periods: list,
+    slow_periods: list,
+    initial_cash: float = 100000.0
+) -> dict:
+    """Run _run_sweep_sync in a worker thread, see run_backtest"""
+    return await asyncio.to_thread(
+        _run_sweep_sync,
+        symbol=symbol,
+        start_date=start_date,
+        end_date=end_date,
+        fast_periods=fast_periods,
+        slow_periods=slow_periods,
+        initial_cash=initial_cash
+    )
@@ -50,14 +50,15 @@ class MovingAverageCrossover(bt.Strategy):
         # Check if an order has been completed
         if order.status in [order.Completed]:
             if order.isbuy():
-                self.log(
-                    f'BUY EXECUTED, Price: {order.executed.price:.2f}, '
-                    f'Cost: {order.executed.value:.2f}, '
-                    f'Comm: {order.executed.comm:.2f}'
-                )
+                if self.params.printlog:
+                    self.log(
+                        f'BUY EXECUTED, Price: {order.executed.price:.2f}, '
+                        f'Cost: {order.executed.value:.2f}, '
+                        f'Comm: {order.executed.comm:.2f}'
+                    )
                 self.buyprice = order.executed.price
                 self.buycomm = order.executed.comm
-            else:  # Sell
+            elif self.params.printlog:  # Sell
                 self.log(
                     f'SELL EXECUTED, Price: {order.executed.price:.2f}, '
                     f'Cost: {order.executed.value:.2f}, '
@@ -72,7 +73,7 @@ class MovingAverageCrossover(bt.Strategy):
     
     def notify_trade(self, trade):
         """Notify when trade is closed"""
-        if not trade.isclosed:
+        if not trade.isclosed or not self.params.printlog:
             return
         
         self.log(
@@ -81,8 +82,10 @@ class MovingAverageCrossover(bt.Strategy):
     
     def next(self):
         """Main strategy logic"""
-        # Simply log the closing price of the series from the reference
-        self.log(f'Close, {self.dataclose[0]:.2f}')
+        # Simply log the closing price of the series from the reference.
+        # Check the flag first so no string is formatted per bar when quiet.
+        if self.params.printlog:
+            self.log(f'Close, {self.dataclose[0]:.2f}')
         
         # Check if an order is pending ... if yes, we cannot send a 2nd one
         if self.order:
@@ -92,13 +95,15 @@ class MovingAverageCrossover(bt.Strategy):
         if not self.position:
             # Not yet ... we MIGHT BUY if conditions are met
             if self.crossover[0] > 0:  # Fast MA crossed above Slow MA
-                self.log(f'BUY CREATE, {self.dataclose[0]:.2f}')
+                if self.params.printlog:
+                    self.log(f'BUY CREATE, {self.dataclose[0]:.2f}')
                 # Keep track of the created order to avoid a 2nd order
                 self.order = self.buy()
         else:
             # Already in the market ... we might sell
             if self.crossover[0] < 0:  # Fast MA crossed below Slow MA
-                self.log(f'SELL CREATE, {self.dataclose[0]:.2f}')
+                if self.params.printlog:
+                    self.log(f'SELL CREATE, {self.dataclose[0]:.2f}')
                 # Keep track of the created order to avoid a 2nd order
                 self.order = self.sell()
     
@@ -110,6 +115,30 @@ class MovingAverageCrossover(bt.Strategy):
             doprint=True
         )
 
+class MACrossSignal(bt.SignalStrategy):
+    """Moving Average Crossover Strategy driven by Backtrader signals
+    
+    Same entries and exits as MovingAverageCrossover, but orders are placed
+    by SignalStrategy itself instead of a user-level next() and notify_*
+    round trip for every bar.
+    """
+    
+    params = (
+        ('fast_period', 10),
+        ('slow_period', 30),
+    )
+    
+    def __init__(self):
+        sma_fast = bt.indicators.SimpleMovingAverage(
+            self.datas[0], period=self.params.fast_period
+        )
+        sma_slow = bt.indicators.SimpleMovingAverage(
+            self.datas[0], period=self.params.slow_period
+        )
+        
+        # Go long on an upward cross, close the position on a downward one
+        self.signal_add(bt.SIGNAL_LONG, bt.indicators.CrossOver(sma_fast, sma_slow))
+
 class BuyAndHold(bt.Strategy):
     """Simple Buy and Hold Strategy for comparison"""
     
@@ -131,15 +160,17 @@ class BuyAndHold(bt.Strategy):
     def notify_order(self, order):
         if order.status in [order.Completed]:
             if order.isbuy():
-                self.log(
-                    f'BUY EXECUTED, Price: {order.executed.price:.2f}'
-                )
+                if self.params.printlog:
+                    self.log(
+                        f'BUY EXECUTED, Price: {order.executed.price:.2f}'
+                    )
                 self.bought = True
         self.order = None
     
     def next(self):
         if not self.bought and not self.order:
-            self.log(f'BUY CREATE, {self.dataclose[0]:.2f}')
+            if self.params.printlog:
+                self.log(f'BUY CREATE, {self.dataclose[0]:.2f}')
             self.order = self.buy()
     
     def stop(self):
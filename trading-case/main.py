@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import router
+from app.backtest import warmup
 
 app = FastAPI(
     title="Trading Case API",
@@ -20,10 +21,15 @@ app.add_middleware(
 # Include API router
 app.include_router(router, prefix="/api", tags=["trading"])
 
+@app.on_event("startup")
+async def _warmup():
+    # Compile the backtest kernels before the first request hits them
+    warmup()
+
 @app.get("/")
 async def root():
     return {"message": "Trading Case API is running", "version": "1.0.0"}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -51,6 +51,30 @@ def test_backtest(name, payload):
         print(f"❌ Error: {response.json()}")
     print()
 
+def test_sweep(name, payload):
+    """Test parameter sweep endpoint with given payload"""
+    print(f"🚀 Testing sweep: {name}")
+    print(f"Request: {json.dumps(payload, indent=2)}")
+    
+    response = requests.post(f"{API_BASE}/api/backtest/sweep", json=payload)
+    print(f"Status: {response.status_code}")
+    
+    if response.status_code == 200:
+        result = response.json()
+        print("✅ Sweep Results:")
+        print(f"   Symbol: {result['symbol']}")
+        print(f"   Period: {result['start_date']} to {result['end_date']}")
+        print(f"   Combinations: {len(result['results'])}")
+        for combo in result['results']:
+            print(
+                f"   MA {combo['fast_period']}/{combo['slow_period']}: "
+                f"${combo['profit_loss']:,.2f} ({combo['profit_loss_percent']:.2f}%), "
+                f"{combo['total_trades']} trades"
+            )
+    else:
+        print(f"❌ Error: {response.json()}")
+    print()
+
 def test_validation_errors():
     """Test validation error handling"""
     print("🔍 Testing validation errors...")
@@ -72,6 +96,25 @@ def test_validation_errors():
         "fast_period": 30,
         "slow_period": 10
     })
+    
+    # Test invalid sweep periods
+    test_sweep("Invalid Sweep Periods", {
+        "symbol": "AAPL",
+        "start_date": "2023-01-01",
+        "end_date": "2023-12-31",
+        "initial_cash": 100000.0,
+        "fast_periods": [50, 60],
+        "slow_periods": [10, 20]
+    })
+
+    test_sweep("Too Many Sweep Combinations", {
+        "symbol": "AAPL",
+        "start_date": "2023-01-01",
+        "end_date": "2023-12-31",
+        "initial_cash": 100000.0,
+        "fast_periods": list(range(1, 201)),
+        "slow_periods": list(range(2, 202))
+    })
 
 def main():
     """Run all tests"""
@@ -110,6 +153,16 @@ def main():
         "slow_period": 50
     })
     
+    # Parameter sweep example
+    test_sweep("AAPL - MA Parameter Sweep", {
+        "symbol": "AAPL",
+        "start_date": "2023-01-01",
+        "end_date": "2023-12-31",
+        "initial_cash": 100000.0,
+        "fast_periods": [5, 10, 20],
+        "slow_periods": [30, 50]
+    })
+    
     # Validation error tests
     test_validation_errors()
     
@@ -122,4 +175,4 @@ if __name__ == "__main__":
         main()
     except requests.exceptions.ConnectionError:
         print("❌ Error: Could not connect to API. Make sure the server is running on http://localhost:8000")
-        print("   Start the server with: python main.py")
\ No newline at end of file
+        print("   Start the server with: python main.py")
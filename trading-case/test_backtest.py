@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Equivalence checks for the backtest engines
+Compares the vectorized kernels with each other and with Backtrader on mock data
+"""
+
+import numpy as np
+
+from app.backtest import (
+    COMMISSION,
+    NUMBA_AVAILABLE,
+    _bt_core,
+    _kernel_prices,
+    _mock_ohlcv,
+    _np_core,
+    _run_backtrader,
+    sweep_ma_crossover,
+    vectorized_ma_crossover,
+)
+
+SYMBOLS = ['AAPL', 'GOOGL', 'XYZ']
+PERIODS = [(10, 30), (5, 20), (20, 50), (3, 50)]
+START_DATE = "2015-01-01"
+END_DATE = "2023-12-31"
+INITIAL_CASH = 100000.0
+LOW_CASH = 1000.0  # Covers one AAPL or XYZ share but not one GOOGL share
+
+def test_numba_matches_numpy():
+    """The Numba kernel and the NumPy fallback produce the same backtest"""
+    if not NUMBA_AVAILABLE:
+        print("⏭️  Numba not installed, skipping kernel comparison")
+        return
+
+    for symbol in SYMBOLS:
+        close = _kernel_prices(_mock_ohlcv(symbol, START_DATE, END_DATE)[1]['Close'])
+        for fast, slow in PERIODS:
+            np_equity, np_trades = _np_core(close, fast, slow, INITIAL_CASH, COMMISSION)
+            nb_equity, nb_trades = _bt_core(close, fast, slow, INITIAL_CASH, COMMISSION)
+            assert np.array_equal(np_trades, nb_trades), (symbol, fast, slow)
+            assert np.allclose(np_equity, nb_equity), (symbol, fast, slow)
+    print("✅ Numba kernel matches NumPy kernel")
+
+def test_sweep_matches_single_runs():
+    """Every sweep combination matches a standalone vectorized backtest"""
+    close = _mock_ohlcv('AAPL', START_DATE, END_DATE)[1]['Close']
+    combos = [(f, s) for f in range(2, 25, 3) for s in range(10, 80, 7) if f < s]
+    fasts = np.array([f for f, _ in combos])
+    slows = np.array([s for _, s in combos])
+
+    final_equity, closed_trades = sweep_ma_crossover(close, fasts, slows, INITIAL_CASH, COMMISSION)
+    for (fast, slow), equity, trades in zip(combos, final_equity, closed_trades):
+        single = vectorized_ma_crossover(close, fast, slow, INITIAL_CASH, COMMISSION)
+        assert trades == single['total_trades'], (fast, slow)
+        assert np.isclose(equity, single['final_cash']), (fast, slow)
+    print(f"✅ Sweep matches single runs over {len(combos)} combinations")
+
+def test_vectorized_matches_backtrader():
+    """The vectorized engine trades on the same bars as Backtrader
+
+    Backtrader fills at the next bar's open while the vectorized engine
+    fills at the signal bar's close, so final values may only differ by the
+    sum of those fill price gaps. Won/lost splits can differ for the same
+    reason. With LOW_CASH both engines must skip the entries cash cannot
+    cover.
+    """
+    for symbol in SYMBOLS:
+        index, columns = _mock_ohlcv(symbol, START_DATE, END_DATE)
+        close = _kernel_prices(columns['Close'])
+        open_ = columns['Open'].astype(np.float64)
+        for cash in (INITIAL_CASH, LOW_CASH):
+            for fast, slow in PERIODS:
+                vectorized = vectorized_ma_crossover(close, fast, slow, cash, COMMISSION)
+                backtrader = _run_backtrader(index, columns, cash, fast, slow)
+                case = (symbol, cash, fast, slow)
+                assert vectorized['total_trades'] == backtrader['total_trades'], case
+
+                _, trades = _np_core(close, fast, slow, cash, COMMISSION)
+                legs = np.flatnonzero(trades[:-1])
+                max_gap = np.abs(open_[legs + 1] - close[legs]).sum() * (1 + COMMISSION)
+                diff = abs(vectorized['final_cash'] - backtrader['final_cash'])
+                assert diff <= max_gap + 1e-6, case + (diff, max_gap)
+
+    # Not even one GOOGL share is affordable, so nothing may be traded
+    close = _mock_ohlcv('GOOGL', START_DATE, END_DATE)[1]['Close']
+    vectorized = vectorized_ma_crossover(close, 10, 30, LOW_CASH, COMMISSION)
+    assert vectorized['total_trades'] == 0 and vectorized['final_cash'] == LOW_CASH
+    print("✅ Vectorized engine matches Backtrader up to fill price differences")
+
+def test_signal_strategy_matches_crossover():
+    """MACrossSignal and MovingAverageCrossover produce identical results"""
+    index, columns = _mock_ohlcv('AAPL', START_DATE, END_DATE)
+    for fast, slow in PERIODS:
+        signal = _run_backtrader(index, columns, INITIAL_CASH, fast, slow, use_signal_strategy=True)
+        crossover = _run_backtrader(index, columns, INITIAL_CASH, fast, slow, use_signal_strategy=False)
+        assert signal == crossover, (fast, slow)
+    print("✅ SignalStrategy matches MovingAverageCrossover")
+
+def main():
+    """Run all checks"""
+    print("=" * 60)
+    print("Backtest Engine Equivalence Checks")
+    print("=" * 60)
+    print()
+
+    test_numba_matches_numpy()
+    test_sweep_matches_single_runs()
+    test_vectorized_matches_backtrader()
+    test_signal_strategy_matches_crossover()
+
+    print()
+    print("=" * 60)
+    print("🎉 All checks passed!")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()